@@ -1,6 +1,8 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request
 import re
 import json
+import hashlib
+import orjson
 from src.ai_engine import EnhancedChatbot
 
 chatbot_bp = Blueprint('chatbot', __name__)
@@ -8,16 +10,27 @@ chatbot_bp = Blueprint('chatbot', __name__)
 # Instância global do chatbot aprimorado
 enhanced_chatbot = EnhancedChatbot()
 
+def _json(payload, status=200):
+    """Resposta JSON serializada com orjson (mais rápido que jsonify)"""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
 @chatbot_bp.route('/chat', methods=['POST'])
 def chat():
     """Endpoint principal para interação com o chatbot aprimorado"""
     try:
-        data = request.get_json()
+        # Corpo decodificado direto com orjson, sem passar pelo get_json
+        body = request.get_data(cache=False)
+        try:
+            data = orjson.loads(body) if body else None
+        except orjson.JSONDecodeError:
+            return _json({
+                'error': 'JSON inválido'
+            }, 400)
         
         if not data or 'message' not in data:
-            return jsonify({
+            return _json({
                 'error': 'Mensagem não fornecida'
-            }), 400
+            }, 400)
         
         user_message = data['message']
         user_id = data.get('user_id', 'default')  # Suporte a múltiplos usuários
@@ -25,7 +38,7 @@ def chat():
         # Processar mensagem com IA avançada
         response_data = enhanced_chatbot.process_message(user_message, user_id)
         
-        return jsonify({
+        return _json({
             'user_message': user_message,
             'bot_response': response_data['response'],
             'response_type': response_data['type'],
@@ -35,17 +48,46 @@ def chat():
         })
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'error': f'Erro interno: {str(e)}'
-        }), 500
+        }, 500)
+
+# Respostas estáticas serializadas uma única vez, servidas com ETag
+_KB_JSON = orjson.dumps({
+    'topics': list(enhanced_chatbot.knowledge_base.keys()),
+    'knowledge_base': enhanced_chatbot.knowledge_base
+})
+_KB_ETAG = hashlib.sha1(_KB_JSON).hexdigest()
+
+_HEALTH_JSON = orjson.dumps({
+    'status': 'healthy',
+    'service': 'Chatbot de Suporte Técnico com IA Avançada',
+    'version': '2.0.0',
+    'features': [
+        'PLN Avançado',
+        'Inferência Lógica',
+        'Diagnóstico Interativo',
+        'Múltiplos Usuários'
+    ]
+})
+_HEALTH_ETAG = hashlib.sha1(_HEALTH_JSON).hexdigest()
+
+# Regras de inferência: um passo de fluxo interativo por regra (os fluxos não mudam em execução)
+_INFERENCE_RULES = sum(len(flow['steps']) for flow in enhanced_chatbot.inference_engine.interactive_flows.values())
+
+# /stats: (diagnósticos ativos, corpo serializado, ETag), regenerado só quando o número de conversas muda
+_stats_cache = (None, b'', '')
+
+def _cached_json(body, etag):
+    """Resposta JSON pré-serializada; responde 304 quando o cliente já tem a mesma versão"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @chatbot_bp.route('/knowledge-base', methods=['GET'])
 def get_knowledge_base():
     """Endpoint para obter a base de conhecimento"""
-    return jsonify({
-        'topics': list(enhanced_chatbot.knowledge_base.keys()),
-        'knowledge_base': enhanced_chatbot.knowledge_base
-    })
+    return _cached_json(_KB_JSON, _KB_ETAG)
 
 @chatbot_bp.route('/diagnostic/start', methods=['POST'])
 def start_diagnostic():
@@ -56,45 +98,41 @@ def start_diagnostic():
         user_id = data.get('user_id', 'default')
         
         if not problem_type:
-            return jsonify({
+            return _json({
                 'error': 'Tipo de problema não especificado'
-            }), 400
+            }, 400)
         
         response = enhanced_chatbot.inference_engine.start_diagnostic(problem_type, user_id)
         
-        return jsonify({
+        return _json({
             'response': response,
             'problem_type': problem_type,
             'user_id': user_id
         })
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'error': f'Erro interno: {str(e)}'
-        }), 500
+        }, 500)
 
 @chatbot_bp.route('/health', methods=['GET'])
 def health_check():
     """Endpoint de verificação de saúde"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Chatbot de Suporte Técnico com IA Avançada',
-        'version': '2.0.0',
-        'features': [
-            'PLN Avançado',
-            'Inferência Lógica',
-            'Diagnóstico Interativo',
-            'Múltiplos Usuários'
-        ]
-    })
+    return _cached_json(_HEALTH_JSON, _HEALTH_ETAG)
 
 @chatbot_bp.route('/stats', methods=['GET'])
 def get_stats():
     """Endpoint para estatísticas do sistema"""
-    return jsonify({
-        'total_topics': len(enhanced_chatbot.knowledge_base),
-        'active_diagnostics': len(enhanced_chatbot.inference_engine.conversation_context),
-        'inference_rules': len(enhanced_chatbot.inference_engine.rules),
-        'synonyms_count': sum(len(synonyms) for synonyms in enhanced_chatbot.nlp_engine.synonyms.values())
-    })
-
+    global _stats_cache
+    active_diagnostics = len(enhanced_chatbot.inference_engine.conversation_context)
+    cached_active, body, etag = _stats_cache
+    if cached_active != active_diagnostics:
+        body = orjson.dumps({
+            'total_topics': len(enhanced_chatbot.knowledge_base),
+            'active_diagnostics': active_diagnostics,
+            'inference_rules': _INFERENCE_RULES,
+            'synonyms_count': sum(len(synonyms) for synonyms in enhanced_chatbot.nlp_engine.synonyms.values())
+        })
+        etag = hashlib.sha1(body).hexdigest()
+        _stats_cache = (active_diagnostics, body, etag)
+    return _cached_json(body, etag)
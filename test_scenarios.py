@@ -4,396 +4,418 @@ Script de testes para o chatbot de suporte técnico com IA.
 Avalia correção, desempenho e limitações do sistema.
 """
 
+import argparse
+import asyncio
+import contextvars
 import requests
 import json
+import re
+import statistics
+import threading
 import time
-from typing import List, Dict, Any
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Union
+from urllib3.util.retry import Retry
 
-class ChatbotTester:
-    def __init__(self, base_url: str = "http://localhost:5000"):
+# Linhas de saída da suíte em execução; None fora de uma suíte (a linha é impressa na hora)
+_suite_output: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar("suite_output", default=None)
+
+# orjson é opcional: sem ele as respostas e os resultados usam o json da biblioteca padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# aiohttp é opcional: só o AsyncChatbotTester precisa dele; sem ele main() usa o ChatbotTester
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Casos de teste compartilhados pelos testadores síncrono e assíncrono: tuplas imutáveis montadas uma única vez,
+# com as palavras-chave já em minúsculas (a resposta do bot é comparada em minúsculas)
+_BASIC_CASES = (
+    {
+        "name": "Saudação",
+        "input": "Olá",
+        "expected_type": "greeting",
+        "expected_keywords": ("assistente", "ajudar")
+    },
+    {
+        "name": "Configuração Wi-Fi",
+        "input": "Como configurar Wi-Fi?",
+        "expected_type": "solution",
+        "expected_keywords": ("configurações", "rede", "senha")
+    },
+    {
+        "name": "Redefinição de Senha",
+        "input": "Esqueci minha senha",
+        "expected_type": "solution",
+        "expected_keywords": ("redefinir", "email", "link")
+    },
+    {
+        "name": "Problema com Impressora",
+        "input": "Impressora não funciona",
+        "expected_type": "solution",
+        "expected_keywords": ("impressora", "ligada", "drivers")
+    },
+    {
+        "name": "Configuração de Email",
+        "input": "Como configurar email?",
+        "expected_type": "solution",
+        "expected_keywords": ("email", "conta", "servidor")
+    },
+    {
+        "name": "Despedida",
+        "input": "Obrigado, tchau",
+        "expected_type": "farewell",
+        "expected_keywords": ("obrigado", "dia")
+    }
+)
+
+# Todas as palavras-chave esperadas, em uma única regex: o lookahead acha ocorrências sobrepostas
+# e, em cada posição, a ordem por tamanho faz vencer a palavra mais longa
+_ALL_KEYWORDS = sorted({keyword for case in _BASIC_CASES for keyword in case["expected_keywords"]},
+                       key=len, reverse=True)
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, _ALL_KEYWORDS)) + '))')
+# Palavra encontrada -> palavras-chave que começam no mesmo ponto (ela própria e seus prefixos)
+_KEYWORD_PREFIXES = {keyword: frozenset(other for other in _ALL_KEYWORDS if keyword.startswith(other))
+                     for keyword in _ALL_KEYWORDS}
+
+def _find_keywords(text: str) -> set:
+    """Palavras-chave esperadas presentes no texto (já em minúsculas), em uma única passada"""
+    found = set()
+    for match in _KEYWORD_RE.finditer(text):
+        found |= _KEYWORD_PREFIXES[match.group(1)]
+    return found
+
+# Diagnóstico Wi-Fi: mensagem inicial e respostas às perguntas, em ordem
+_DIAGNOSTIC_START = "diagnóstico wifi"
+_DIAGNOSTIC_ANSWERS = ("sim", "não", "sim", "sim")
+
+_NLP_CASES = (
+    {
+        "name": "Variações Wi-Fi",
+        "inputs": (
+            "Como configurar wifi?",
+            "Configuração de wi-fi",
+            "Ajuda com internet",
+            "Conectar na rede wireless"
+        ),
+        "expected_topic": "wifi"
+    },
+    {
+        "name": "Variações Senha",
+        "inputs": (
+            "Perdi minha senha",
+            "Não lembro da password",
+            "Resetar senha",
+            "Como recuperar acesso?"
+        ),
+        "expected_topic": "senha"
+    },
+    {
+        "name": "Linguagem Informal",
+        "inputs": (
+            "Oi, tudo bem?",
+            "E aí!",
+            "Olá, como vai?",
+            "Bom dia!"
+        ),
+        "expected_type": "greeting"
+    }
+)
+
+_PERFORMANCE_MESSAGES = (
+    "Olá",
+    "Como configurar Wi-Fi?",
+    "Esqueci minha senha",
+    "Problema com impressora",
+    "diagnóstico wifi"
+)
+
+# Repetições de falhas transitórias (mesma política nos dois testadores): até _RETRY_TOTAL novas tentativas,
+# com espera exponencial a partir de _RETRY_BACKOFF segundos
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.1
+_RETRY_STATUSES = (502, 503, 504)
+
+# Requisições descartadas antes de medir (custo de inicialização do servidor)
+_WARM_UP_ROUNDS = 2
+
+_EDGE_CASES = (
+    {
+        "name": "Mensagem Vazia",
+        "input": "",
+        "should_handle_gracefully": True
+    },
+    {
+        "name": "Mensagem Muito Longa",
+        "input": "a" * 1000,
+        "should_handle_gracefully": True
+    },
+    {
+        "name": "Caracteres Especiais",
+        "input": "!@#$%^&*()",
+        "should_handle_gracefully": True
+    },
+    {
+        "name": "Pergunta Ambígua",
+        "input": "Não funciona",
+        "should_handle_gracefully": True
+    },
+    {
+        "name": "Idioma Estrangeiro",
+        "input": "Hello, how are you?",
+        "should_handle_gracefully": True
+    }
+)
+
+# Resultados de caso com atributos fixos (__slots__); cada suíte tem o seu formato
+@dataclass(slots=True)
+class BasicCaseResult:
+    """Resultado de um caso de funcionalidade básica"""
+    test_name: str
+    input: str
+    response: str
+    type_correct: bool
+    keywords_score: float
+    confidence: float
+    passed: bool
+
+@dataclass(slots=True)
+class EdgeCaseResult:
+    """Resultado de um caso extremo"""
+    test_name: str
+    input: str
+    handled_gracefully: bool
+    response: str
+    passed: bool
+
+@dataclass(slots=True)
+class CaseError:
+    """Caso (básico ou extremo) que falhou com erro"""
+    test_name: str
+    error: str
+    passed: bool = False
+
+_CASE_RESULT_TYPES = (BasicCaseResult, EdgeCaseResult, CaseError)
+
+class _BaseChatbotTester:
+    """Verificações dos casos, resultados e resumo comuns às variantes síncrona e assíncrona;
+    o envio das mensagens e a execução das suítes ficam em cada subclasse"""
+    
+    def __init__(self, base_url: str = "http://localhost:5000", max_concurrent: int = 4):
         self.base_url = base_url
         self.test_results = []
+        # Máximo de requisições ao servidor em voo ao mesmo tempo, somando todas as suítes; o padrão é
+        # conservador para não sobrecarregar o servidor de desenvolvimento do Flask
+        self.max_concurrent = max_concurrent
+        # As suítes rodam em paralelo: a saída de cada uma é impressa inteira, quando ela termina
+        self._print_lock = threading.Lock()
+        # Mensagem -> resposta do servidor ao abrir uma conversa com ela
+        self._response_cache: Dict[str, Dict[str, Any]] = {}
     
-    def test_basic_functionality(self) -> Dict[str, Any]:
-        """Testa funcionalidades básicas do chatbot"""
-        print("=== Testando Funcionalidades Básicas ===")
-        
-        test_cases = [
-            {
-                "name": "Saudação",
-                "input": "Olá",
-                "expected_type": "greeting",
-                "expected_keywords": ["assistente", "ajudar"]
-            },
-            {
-                "name": "Configuração Wi-Fi",
-                "input": "Como configurar Wi-Fi?",
-                "expected_type": "solution",
-                "expected_keywords": ["configurações", "rede", "senha"]
-            },
-            {
-                "name": "Redefinição de Senha",
-                "input": "Esqueci minha senha",
-                "expected_type": "solution",
-                "expected_keywords": ["redefinir", "email", "link"]
-            },
-            {
-                "name": "Problema com Impressora",
-                "input": "Impressora não funciona",
-                "expected_type": "solution",
-                "expected_keywords": ["impressora", "ligada", "drivers"]
-            },
-            {
-                "name": "Configuração de Email",
-                "input": "Como configurar email?",
-                "expected_type": "solution",
-                "expected_keywords": ["email", "conta", "servidor"]
-            },
-            {
-                "name": "Despedida",
-                "input": "Obrigado, tchau",
-                "expected_type": "farewell",
-                "expected_keywords": ["obrigado", "dia"]
-            }
-        ]
+    def _check_basic_case(self, test_case: Dict[str, Any], response: Dict[str, Any]) -> BasicCaseResult:
+        """Avalia a resposta de um caso de funcionalidade básica"""
+        # Verificar tipo de resposta
+        type_correct = response.get("response_type") == test_case["expected_type"]
         
-        results = []
-        for test_case in test_cases:
-            try:
-                response = self._send_message(test_case["input"])
-                
-                # Verificar tipo de resposta
-                type_correct = response.get("response_type") == test_case["expected_type"]
-                
-                # Verificar palavras-chave na resposta
-                bot_response = response.get("bot_response", "").lower()
-                keywords_found = sum(1 for keyword in test_case["expected_keywords"] 
-                                   if keyword in bot_response)
-                keywords_score = keywords_found / len(test_case["expected_keywords"])
-                
-                result = {
-                    "test_name": test_case["name"],
-                    "input": test_case["input"],
-                    "response": bot_response,
-                    "type_correct": type_correct,
-                    "keywords_score": keywords_score,
-                    "confidence": response.get("confidence", 0),
-                    "passed": type_correct and keywords_score >= 0.5
-                }
-                
-                results.append(result)
-                print(f"✓ {test_case['name']}: {'PASSOU' if result['passed'] else 'FALHOU'}")
-                
-            except Exception as e:
-                print(f"✗ {test_case['name']}: ERRO - {str(e)}")
-                results.append({
-                    "test_name": test_case["name"],
-                    "error": str(e),
-                    "passed": False
-                })
+        # Verificar palavras-chave na resposta
+        bot_response = response.get("bot_response", "").lower()
+        found = _find_keywords(bot_response)
+        keywords_found = sum(1 for keyword in test_case["expected_keywords"] if keyword in found)
+        keywords_score = keywords_found / len(test_case["expected_keywords"])
         
-        return {
-            "test_type": "basic_functionality",
-            "results": results,
-            "pass_rate": sum(1 for r in results if r.get("passed", False)) / len(results)
-        }
+        result = BasicCaseResult(
+            test_name=test_case["name"],
+            input=test_case["input"],
+            response=bot_response,
+            type_correct=type_correct,
+            keywords_score=keywords_score,
+            confidence=response.get("confidence", 0),
+            passed=type_correct and keywords_score >= 0.5
+        )
+        
+        self._log(f"✓ {test_case['name']}: {'PASSOU' if result.passed else 'FALHOU'}")
+        return result
     
-    def test_diagnostic_system(self) -> Dict[str, Any]:
-        """Testa o sistema de diagnóstico interativo"""
-        print("\n=== Testando Sistema de Diagnóstico ===")
+    def _case_error(self, test_case: Dict[str, Any], e: Exception) -> CaseError:
+        """Resultado de um caso que falhou com erro"""
+        self._log(f"✗ {test_case['name']}: ERRO - {str(e)}")
+        return CaseError(test_name=test_case["name"], error=str(e))
+    
+    def _diagnostic_started(self, response: Dict[str, Any]) -> bool:
+        """Verifica se a resposta inicial abriu o diagnóstico"""
+        return "perguntas" in response.get("bot_response", "").lower()
+    
+    def _check_diagnostic(self, response1: Dict[str, Any], final_response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Avalia o diagnóstico a partir da resposta inicial e da última resposta"""
+        diagnostic_started = self._diagnostic_started(response1)
         
-        # Teste 1: Iniciar diagnóstico Wi-Fi
-        try:
-            response1 = self._send_message("diagnóstico wifi")
-            diagnostic_started = "perguntas" in response1.get("bot_response", "").lower()
-            
-            if diagnostic_started:
-                # Simular respostas ao diagnóstico
-                responses = ["sim", "não", "sim", "sim"]
-                final_response = None
-                
-                for i, answer in enumerate(responses):
-                    response = self._send_message(answer)
-                    if i == len(responses) - 1:  # Última resposta
-                        final_response = response
-                
-                solution_provided = final_response and "recomendo" in final_response.get("bot_response", "").lower()
-                
-                result = {
-                    "test_name": "Diagnóstico Wi-Fi Completo",
-                    "diagnostic_started": diagnostic_started,
-                    "solution_provided": solution_provided,
-                    "final_response": final_response.get("bot_response", "") if final_response else "",
-                    "passed": diagnostic_started and solution_provided
-                }
-            else:
-                result = {
-                    "test_name": "Diagnóstico Wi-Fi Completo",
-                    "diagnostic_started": False,
-                    "passed": False
-                }
-            
-            print(f"✓ Diagnóstico Wi-Fi: {'PASSOU' if result['passed'] else 'FALHOU'}")
+        if diagnostic_started:
+            solution_provided = final_response and "recomendo" in final_response.get("bot_response", "").lower()
             
-        except Exception as e:
-            print(f"✗ Diagnóstico Wi-Fi: ERRO - {str(e)}")
             result = {
                 "test_name": "Diagnóstico Wi-Fi Completo",
-                "error": str(e),
+                "diagnostic_started": diagnostic_started,
+                "solution_provided": solution_provided,
+                "final_response": final_response.get("bot_response", "") if final_response else "",
+                "passed": diagnostic_started and solution_provided
+            }
+        else:
+            result = {
+                "test_name": "Diagnóstico Wi-Fi Completo",
+                "diagnostic_started": False,
                 "passed": False
             }
         
+        self._log(f"✓ Diagnóstico Wi-Fi: {'PASSOU' if result['passed'] else 'FALHOU'}")
+        return result
+    
+    def _diagnostic_error(self, e: Exception) -> Dict[str, Any]:
+        """Resultado do diagnóstico que falhou com erro"""
+        self._log(f"✗ Diagnóstico Wi-Fi: ERRO - {str(e)}")
         return {
-            "test_type": "diagnostic_system",
-            "results": [result],
-            "pass_rate": 1.0 if result.get("passed", False) else 0.0
+            "test_name": "Diagnóstico Wi-Fi Completo",
+            "error": str(e),
+            "passed": False
         }
     
-    def test_nlp_capabilities(self) -> Dict[str, Any]:
-        """Testa capacidades de PLN (variações de linguagem)"""
-        print("\n=== Testando Capacidades de PLN ===")
-        
-        nlp_test_cases = [
-            {
-                "name": "Variações Wi-Fi",
-                "inputs": [
-                    "Como configurar wifi?",
-                    "Configuração de wi-fi",
-                    "Ajuda com internet",
-                    "Conectar na rede wireless"
-                ],
-                "expected_topic": "wifi"
-            },
-            {
-                "name": "Variações Senha",
-                "inputs": [
-                    "Perdi minha senha",
-                    "Não lembro da password",
-                    "Resetar senha",
-                    "Como recuperar acesso?"
-                ],
-                "expected_topic": "senha"
-            },
-            {
-                "name": "Linguagem Informal",
-                "inputs": [
-                    "Oi, tudo bem?",
-                    "E aí!",
-                    "Olá, como vai?",
-                    "Bom dia!"
-                ],
-                "expected_type": "greeting"
-            }
-        ]
-        
-        results = []
-        for test_group in nlp_test_cases:
-            group_results = []
-            
-            for input_text in test_group["inputs"]:
-                try:
-                    response = self._send_message(input_text)
-                    
-                    if "expected_topic" in test_group:
-                        correct = response.get("topic") == test_group["expected_topic"]
-                    else:
-                        correct = response.get("response_type") == test_group["expected_type"]
-                    
-                    group_results.append({
-                        "input": input_text,
-                        "response_type": response.get("response_type"),
-                        "topic": response.get("topic"),
-                        "confidence": response.get("confidence", 0),
-                        "correct": correct
-                    })
-                    
-                except Exception as e:
-                    group_results.append({
-                        "input": input_text,
-                        "error": str(e),
-                        "correct": False
-                    })
-            
-            group_pass_rate = sum(1 for r in group_results if r.get("correct", False)) / len(group_results)
-            
-            results.append({
-                "test_name": test_group["name"],
-                "individual_results": group_results,
-                "pass_rate": group_pass_rate,
-                "passed": group_pass_rate >= 0.7  # 70% de acerto
-            })
-            
-            print(f"✓ {test_group['name']}: {group_pass_rate:.1%} de acerto")
+    def _check_nlp_input(self, test_group: Dict[str, Any], input_text: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Avalia a resposta a uma variação de linguagem"""
+        if "expected_topic" in test_group:
+            correct = response.get("topic") == test_group["expected_topic"]
+        else:
+            correct = response.get("response_type") == test_group["expected_type"]
         
         return {
-            "test_type": "nlp_capabilities",
-            "results": results,
-            "pass_rate": sum(1 for r in results if r.get("passed", False)) / len(results)
+            "input": input_text,
+            "response_type": response.get("response_type"),
+            "topic": response.get("topic"),
+            "confidence": response.get("confidence", 0),
+            "correct": correct
         }
     
-    def test_performance(self) -> Dict[str, Any]:
-        """Testa performance do sistema"""
-        print("\n=== Testando Performance ===")
-        
-        test_messages = [
-            "Olá",
-            "Como configurar Wi-Fi?",
-            "Esqueci minha senha",
-            "Problema com impressora",
-            "diagnóstico wifi"
-        ]
+    def _nlp_input_error(self, input_text: str, e: Exception) -> Dict[str, Any]:
+        """Resultado de uma variação de linguagem que falhou com erro"""
+        return {
+            "input": input_text,
+            "error": str(e),
+            "correct": False
+        }
+    
+    def _nlp_group_result(self, test_group: Dict[str, Any], group_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Consolida os resultados de um grupo de variações de linguagem"""
+        group_pass_rate = sum(1 for r in group_results if r.get("correct", False)) / len(group_results)
         
-        response_times = []
-        
-        for message in test_messages:
-            try:
-                start_time = time.time()
-                response = self._send_message(message)
-                end_time = time.time()
-                
-                response_time = end_time - start_time
-                response_times.append(response_time)
-                
-            except Exception as e:
-                print(f"Erro ao testar performance com '{message}': {e}")
+        self._log(f"✓ {test_group['name']}: {group_pass_rate:.1%} de acerto")
         
+        return {
+            "test_name": test_group["name"],
+            "individual_results": group_results,
+            "pass_rate": group_pass_rate,
+            "passed": group_pass_rate >= 0.7  # 70% de acerto
+        }
+    
+    def _performance_result(self, response_times: List[float]) -> Dict[str, Any]:
+        """Consolida os tempos de resposta medidos"""
         if response_times:
-            avg_response_time = sum(response_times) / len(response_times)
+            avg_response_time = statistics.fmean(response_times)
             max_response_time = max(response_times)
             min_response_time = min(response_times)
+            # Percentis com interpolação linear entre as amostras (quantiles exige ao menos duas)
+            if len(response_times) > 1:
+                percentiles = statistics.quantiles(response_times, n=100, method="inclusive")
+                p50_response_time, p95_response_time = percentiles[49], percentiles[94]
+            else:
+                p50_response_time = p95_response_time = response_times[0]
             
             # Critério: resposta em menos de 2 segundos em média
             performance_good = avg_response_time < 2.0
             
-            print(f"✓ Tempo médio de resposta: {avg_response_time:.2f}s")
-            print(f"✓ Tempo máximo: {max_response_time:.2f}s")
-            print(f"✓ Tempo mínimo: {min_response_time:.2f}s")
+            self._log(f"✓ Tempo médio de resposta: {avg_response_time:.2f}s")
+            self._log(f"✓ Tempo máximo: {max_response_time:.2f}s")
+            self._log(f"✓ Tempo mínimo: {min_response_time:.2f}s")
+            self._log(f"✓ p50: {p50_response_time:.2f}s | p95: {p95_response_time:.2f}s")
             
-            return {
-                "test_type": "performance",
+            result = {
+                "test_name": "Tempo de Resposta",
                 "avg_response_time": avg_response_time,
                 "max_response_time": max_response_time,
                 "min_response_time": min_response_time,
+                "p50_response_time": p50_response_time,
+                "p95_response_time": p95_response_time,
                 "performance_good": performance_good,
                 "passed": performance_good
             }
         else:
-            return {
-                "test_type": "performance",
+            result = {
+                "test_name": "Tempo de Resposta",
                 "error": "Não foi possível medir performance",
                 "passed": False
             }
+        
+        return self._suite_result("performance", [result])
     
-    def test_edge_cases(self) -> Dict[str, Any]:
-        """Testa casos extremos e limitações"""
-        print("\n=== Testando Casos Extremos ===")
-        
-        edge_cases = [
-            {
-                "name": "Mensagem Vazia",
-                "input": "",
-                "should_handle_gracefully": True
-            },
-            {
-                "name": "Mensagem Muito Longa",
-                "input": "a" * 1000,
-                "should_handle_gracefully": True
-            },
-            {
-                "name": "Caracteres Especiais",
-                "input": "!@#$%^&*()",
-                "should_handle_gracefully": True
-            },
-            {
-                "name": "Pergunta Ambígua",
-                "input": "Não funciona",
-                "should_handle_gracefully": True
-            },
-            {
-                "name": "Idioma Estrangeiro",
-                "input": "Hello, how are you?",
-                "should_handle_gracefully": True
-            }
-        ]
+    def _check_edge_case(self, case: Dict[str, Any], response: Dict[str, Any]) -> EdgeCaseResult:
+        """Avalia se o sistema respondeu a um caso extremo sem erro"""
+        handled_gracefully = "error" not in response and bool(response.get("bot_response"))
         
-        results = []
-        for case in edge_cases:
-            try:
-                response = self._send_message(case["input"])
-                
-                # Verificar se o sistema respondeu sem erro
-                handled_gracefully = "error" not in response and response.get("bot_response")
-                
-                result = {
-                    "test_name": case["name"],
-                    "input": case["input"],
-                    "handled_gracefully": handled_gracefully,
-                    "response": response.get("bot_response", ""),
-                    "passed": handled_gracefully
-                }
-                
-                results.append(result)
-                print(f"✓ {case['name']}: {'PASSOU' if result['passed'] else 'FALHOU'}")
-                
-            except Exception as e:
-                print(f"✗ {case['name']}: ERRO - {str(e)}")
-                results.append({
-                    "test_name": case["name"],
-                    "error": str(e),
-                    "passed": False
-                })
+        result = EdgeCaseResult(
+            test_name=case["name"],
+            input=case["input"],
+            handled_gracefully=handled_gracefully,
+            response=response.get("bot_response", ""),
+            passed=handled_gracefully
+        )
         
+        self._log(f"✓ {case['name']}: {'PASSOU' if result.passed else 'FALHOU'}")
+        return result
+    
+    def _suite_result(self, test_type: str, results: List[Any]) -> Dict[str, Any]:
+        """Resultado de uma suíte; todas seguem o formato {"test_type", "results", "pass_rate"}"""
+        # Resultados em dataclass viram dicts rasos (só os campos do seu formato), prontos para o resumo e o JSON
+        results = [{name: getattr(r, name) for name in r.__slots__} if isinstance(r, _CASE_RESULT_TYPES) else r
+                   for r in results]
         return {
-            "test_type": "edge_cases",
+            "test_type": test_type,
             "results": results,
             "pass_rate": sum(1 for r in results if r.get("passed", False)) / len(results)
         }
     
-    def _send_message(self, message: str) -> Dict[str, Any]:
-        """Envia mensagem para o chatbot e retorna resposta"""
-        url = f"{self.base_url}/api/chat"
-        payload = {"message": message}
-        
-        response = requests.post(url, json=payload, timeout=10)
-        response.raise_for_status()
-        
-        return response.json()
+    def _log(self, text: str):
+        """Registra uma linha na saída da suíte em execução (ou a imprime, fora de uma suíte)"""
+        lines = _suite_output.get()
+        if lines is None:
+            self._print_lines([text])
+        else:
+            lines.append(text)
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Executa todos os testes"""
+    def _print_lines(self, lines: List[str]):
+        """Imprime um bloco de linhas sem intercalar com a saída de outras threads"""
+        with self._print_lock:
+            print("\n".join(lines))
+    
+    def _new_user_id(self) -> str:
+        """Id de usuário exclusivo, para que casos paralelos não compartilhem o contexto de conversa"""
+        return f"tester-{uuid.uuid4().hex}"
+    
+    def _print_header(self):
+        """Imprime o cabeçalho da execução"""
         print("🤖 Iniciando Testes do Chatbot de Suporte Técnico com IA")
         print("=" * 60)
-        
-        # Verificar se o servidor está rodando
-        try:
-            health_response = requests.get(f"{self.base_url}/api/health", timeout=5)
-            health_response.raise_for_status()
-            print("✓ Servidor está online e funcionando")
-        except Exception as e:
-            print(f"✗ Erro ao conectar com o servidor: {e}")
-            return {"error": "Servidor não está acessível"}
-        
-        # Executar todos os testes
-        test_results = {
-            "basic_functionality": self.test_basic_functionality(),
-            "diagnostic_system": self.test_diagnostic_system(),
-            "nlp_capabilities": self.test_nlp_capabilities(),
-            "performance": self.test_performance(),
-            "edge_cases": self.test_edge_cases()
-        }
-        
-        # Calcular estatísticas gerais
-        total_tests = 0
-        passed_tests = 0
-        
-        for test_type, results in test_results.items():
-            if "pass_rate" in results:
-                if isinstance(results["results"], list):
-                    total_tests += len(results["results"])
-                    passed_tests += int(results["pass_rate"] * len(results["results"]))
-                else:
-                    total_tests += 1
-                    passed_tests += 1 if results.get("passed", False) else 0
+    
+    def _summarize(self, test_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Calcula e imprime as estatísticas gerais, acrescentando o resumo aos resultados"""
+        # Calcular estatísticas gerais (todas as suítes seguem o formato de _suite_result)
+        total_tests = sum(len(results["results"]) for results in test_results.values())
+        passed_tests = sum(round(results["pass_rate"] * len(results["results"])) for results in test_results.values())
         
         overall_pass_rate = passed_tests / total_tests if total_tests > 0 else 0
         
@@ -422,14 +444,459 @@ class ChatbotTester:
         
         return test_results
 
+class ChatbotTester(_BaseChatbotTester):
+    """Variante síncrona (requests + threads): os casos de cada suíte rodam num pool de max_concurrent threads"""
+    
+    def __init__(self, base_url: str = "http://localhost:5000", max_concurrent: int = 4):
+        super().__init__(base_url, max_concurrent)
+        # Vagas de requisição: toda chamada ao servidor ocupa uma, inclusive as feitas direto pela thread da suíte
+        self._sem = threading.BoundedSemaphore(max_concurrent)
+        # Um único pool para os casos de todas as suítes (as threads só são criadas no primeiro uso):
+        # suítes em paralelo disputam as mesmas max_concurrent threads em vez de abrir um pool cada
+        self._case_executor = ThreadPoolExecutor(max_workers=max_concurrent)
+        
+        # Sessão HTTP aberta já aqui, para que as suítes também possam ser chamadas avulsas
+        self.session = self._new_session()
+    
+    def test_basic_functionality(self) -> Dict[str, Any]:
+        """Testa funcionalidades básicas do chatbot"""
+        self._log("\n=== Testando Funcionalidades Básicas ===")
+        
+        results = self._run_cases_parallel(_BASIC_CASES, self._run_basic_case)
+        
+        return self._suite_result("basic_functionality", results)
+    
+    def _run_basic_case(self, test_case: Dict[str, Any]) -> Union[BasicCaseResult, CaseError]:
+        """Executa um caso de funcionalidade básica (em conversa própria)"""
+        try:
+            response = self._send_message(test_case["input"])
+            return self._check_basic_case(test_case, response)
+        except Exception as e:
+            return self._case_error(test_case, e)
+    
+    def test_diagnostic_system(self) -> Dict[str, Any]:
+        """Testa o sistema de diagnóstico interativo"""
+        self._log("\n=== Testando Sistema de Diagnóstico ===")
+        
+        # Teste 1: Iniciar diagnóstico Wi-Fi
+        try:
+            user_id = self._new_user_id()
+            response1 = self._send_message(_DIAGNOSTIC_START, user_id=user_id)
+            final_response = None
+            
+            if self._diagnostic_started(response1):
+                # Simular respostas ao diagnóstico; a última resposta traz a solução
+                for answer in _DIAGNOSTIC_ANSWERS:
+                    final_response = self._send_message(answer, user_id=user_id)
+            
+            result = self._check_diagnostic(response1, final_response)
+        
+        except Exception as e:
+            result = self._diagnostic_error(e)
+        
+        return self._suite_result("diagnostic_system", [result])
+    
+    def test_nlp_capabilities(self) -> Dict[str, Any]:
+        """Testa capacidades de PLN (variações de linguagem)"""
+        self._log("\n=== Testando Capacidades de PLN ===")
+        
+        results = []
+        for test_group in _NLP_CASES:
+            group_results = self._run_cases_parallel(test_group["inputs"], partial(self._run_nlp_input, test_group))
+            results.append(self._nlp_group_result(test_group, group_results))
+        
+        return self._suite_result("nlp_capabilities", results)
+    
+    def _run_nlp_input(self, test_group: Dict[str, Any], input_text: str) -> Dict[str, Any]:
+        """Envia uma variação de linguagem (em conversa própria) e verifica o tópico/tipo reconhecido"""
+        try:
+            response = self._send_message(input_text)
+            return self._check_nlp_input(test_group, input_text, response)
+        except Exception as e:
+            return self._nlp_input_error(input_text, e)
+    
+    def test_performance(self) -> Dict[str, Any]:
+        """Testa performance do sistema"""
+        self._log("\n=== Testando Performance ===")
+        
+        self._warm_up()
+        response_times = [response_time
+                          for response_time in self._run_cases_parallel(_PERFORMANCE_MESSAGES, self._time_message)
+                          if response_time is not None]
+        
+        return self._performance_result(response_times)
+    
+    def _warm_up(self):
+        """Descarta as primeiras requisições, que pagam o custo de inicialização do servidor"""
+        for _ in range(_WARM_UP_ROUNDS):
+            try:
+                self._send_message("Olá", cache=False)
+            except Exception:
+                # Se o servidor falhar aqui, a medição abaixo registra o erro
+                pass
+    
+    def _time_message(self, message: str) -> Optional[float]:
+        """Mede o tempo de resposta de uma mensagem (em conversa própria); None em caso de erro"""
+        try:
+            # O relógio começa com a vaga de requisição já obtida: a espera por ela não entra na medida
+            with self._sem:
+                start_time = time.perf_counter()
+                self._post(message, self._new_user_id())
+                end_time = time.perf_counter()
+            
+            return end_time - start_time
+        
+        except Exception as e:
+            self._log(f"Erro ao testar performance com '{message}': {e}")
+            return None
+    
+    def test_edge_cases(self) -> Dict[str, Any]:
+        """Testa casos extremos e limitações"""
+        self._log("\n=== Testando Casos Extremos ===")
+        
+        results = self._run_cases_parallel(_EDGE_CASES, self._run_edge_case)
+        
+        return self._suite_result("edge_cases", results)
+    
+    def _run_edge_case(self, case: Dict[str, Any]) -> Union[EdgeCaseResult, CaseError]:
+        """Executa um caso extremo (em conversa própria)"""
+        try:
+            response = self._send_message(case["input"])
+            return self._check_edge_case(case, response)
+        except Exception as e:
+            return self._case_error(case, e)
+    
+    def _run_suite(self, suite) -> Dict[str, Any]:
+        """Executa uma suíte guardando sua saída, que é impressa de uma vez quando ela termina"""
+        lines = []
+        token = _suite_output.set(lines)
+        try:
+            return suite()
+        finally:
+            _suite_output.reset(token)
+            self._print_lines(lines)
+    
+    def _run_cases_parallel(self, cases, fn) -> List[Any]:
+        """Executa fn para cada caso no pool compartilhado (até max_concurrent), mantendo a ordem dos resultados"""
+        # Cada caso roda numa cópia do contexto atual, para o _log chegar à saída da suíte
+        futures = [self._case_executor.submit(contextvars.copy_context().run, fn, case) for case in cases]
+        return [future.result() for future in futures]
+    
+    def _send_message(self, message: str, user_id: Optional[str] = None, cache: bool = True) -> Dict[str, Any]:
+        """Envia mensagem para o chatbot e retorna resposta.
+        
+        Sem user_id, a mensagem abre uma conversa nova; essa resposta só depende do texto
+        e fica em cache (cache=False força a requisição, p.ex. para medir o tempo do servidor).
+        """
+        cacheable = cache and user_id is None
+        if cacheable and message in self._response_cache:
+            return self._response_cache[message]
+        
+        with self._sem:
+            data = self._post(message, user_id or self._new_user_id())
+        
+        if cacheable:
+            self._response_cache[message] = data
+        return data
+    
+    def _post(self, message: str, user_id: str) -> Dict[str, Any]:
+        """Envia a mensagem ao servidor (chamado com a vaga de requisição já obtida)"""
+        url = f"{self.base_url}/api/chat"
+        payload = {"message": message, "user_id": user_id}
+        
+        response = self.session.post(url, json=payload, timeout=10)
+        # Só passa pelo tratamento de erro do requests quando a resposta não é 200
+        if response.status_code != 200:
+            response.raise_for_status()
+        
+        return orjson.loads(response.content) if orjson is not None else response.json()
+    
+    def _new_session(self) -> requests.Session:
+        """Sessão compartilhada: todas as requisições reaproveitam as conexões abertas com o servidor"""
+        # O pool do urllib3 é LIFO, então a conexão mais recente volta a ser usada.
+        # Falhas transitórias são repetidas; o POST não é idempotente, então só
+        # erros de conexão são repetidos para ele (allowed_methods padrão).
+        session = requests.Session()
+        retry = Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF, status_forcelist=_RETRY_STATUSES)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """Fecha a sessão HTTP e o pool dos casos"""
+        self.session.close()
+        self._case_executor.shutdown()
+    
+    def run_all_tests(self) -> Dict[str, Any]:
+        """Executa todos os testes"""
+        self._print_header()
+        
+        # Verificar se o servidor está rodando
+        try:
+            health_response = self.session.get(f"{self.base_url}/api/health", timeout=5)
+            health_response.raise_for_status()
+            print("✓ Servidor está online e funcionando")
+        except Exception as e:
+            print(f"✗ Erro ao conectar com o servidor: {e}")
+            return {"error": "Servidor não está acessível"}
+        
+        # Executar todos os testes (as suítes são independentes e rodam em paralelo)
+        suites = {
+            "basic_functionality": self.test_basic_functionality,
+            "diagnostic_system": self.test_diagnostic_system,
+            "nlp_capabilities": self.test_nlp_capabilities,
+            "edge_cases": self.test_edge_cases
+        }
+        # As threads das suítes só coordenam: os casos de todas vão para o mesmo pool de max_concurrent threads
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = {name: executor.submit(self._run_suite, suite) for name, suite in suites.items()}
+            test_results = {name: future.result() for name, future in futures.items()}
+        
+        # Performance medida depois das outras suítes, sem a carga delas no servidor
+        test_results["performance"] = self._run_suite(self.test_performance)
+        
+        return self._summarize(test_results)
+
+class AsyncChatbotTester(_BaseChatbotTester):
+    """Variante assíncrona (asyncio + aiohttp): os casos de cada suíte ficam em voo ao mesmo tempo,
+    limitados por um semáforo de max_concurrent requisições"""
+    
+    def __init__(self, base_url: str = "http://localhost:5000", max_concurrent: int = 4):
+        if aiohttp is None:
+            raise ImportError("AsyncChatbotTester requer o pacote aiohttp")
+        super().__init__(base_url, max_concurrent)
+        self._sem = asyncio.Semaphore(max_concurrent)
+        
+        # A ClientSession precisa de um loop rodando: é aberta na primeira requisição (_request)
+        # e fechada por close, que deixa o tester pronto para outro asyncio.run
+        self.session = None
+    
+    async def test_basic_functionality(self) -> Dict[str, Any]:
+        """Testa funcionalidades básicas do chatbot"""
+        self._log("\n=== Testando Funcionalidades Básicas ===")
+        
+        results = await asyncio.gather(*[self._run_basic_case(test_case) for test_case in _BASIC_CASES])
+        
+        return self._suite_result("basic_functionality", results)
+    
+    async def _run_basic_case(self, test_case: Dict[str, Any]) -> Union[BasicCaseResult, CaseError]:
+        """Executa um caso de funcionalidade básica (em conversa própria)"""
+        try:
+            response = await self._send_message(test_case["input"])
+            return self._check_basic_case(test_case, response)
+        except Exception as e:
+            return self._case_error(test_case, e)
+    
+    async def test_diagnostic_system(self) -> Dict[str, Any]:
+        """Testa o sistema de diagnóstico interativo (conversa sequencial)"""
+        self._log("\n=== Testando Sistema de Diagnóstico ===")
+        
+        try:
+            user_id = self._new_user_id()
+            response1 = await self._send_message(_DIAGNOSTIC_START, user_id=user_id)
+            final_response = None
+            
+            if self._diagnostic_started(response1):
+                for answer in _DIAGNOSTIC_ANSWERS:
+                    final_response = await self._send_message(answer, user_id=user_id)
+            
+            result = self._check_diagnostic(response1, final_response)
+        
+        except Exception as e:
+            result = self._diagnostic_error(e)
+        
+        return self._suite_result("diagnostic_system", [result])
+    
+    async def test_nlp_capabilities(self) -> Dict[str, Any]:
+        """Testa capacidades de PLN (variações de linguagem)"""
+        self._log("\n=== Testando Capacidades de PLN ===")
+        
+        results = []
+        for test_group in _NLP_CASES:
+            group_results = await asyncio.gather(*[self._run_nlp_input(test_group, input_text)
+                                                   for input_text in test_group["inputs"]])
+            results.append(self._nlp_group_result(test_group, group_results))
+        
+        return self._suite_result("nlp_capabilities", results)
+    
+    async def _run_nlp_input(self, test_group: Dict[str, Any], input_text: str) -> Dict[str, Any]:
+        """Envia uma variação de linguagem (em conversa própria) e verifica o tópico/tipo reconhecido"""
+        try:
+            response = await self._send_message(input_text)
+            return self._check_nlp_input(test_group, input_text, response)
+        except Exception as e:
+            return self._nlp_input_error(input_text, e)
+    
+    async def test_performance(self) -> Dict[str, Any]:
+        """Testa performance do sistema"""
+        self._log("\n=== Testando Performance ===")
+        
+        await self._warm_up()
+        response_times = [response_time
+                          for response_time in await asyncio.gather(*[self._time_message(message)
+                                                                      for message in _PERFORMANCE_MESSAGES])
+                          if response_time is not None]
+        
+        return self._performance_result(response_times)
+    
+    async def _warm_up(self):
+        """Descarta as primeiras requisições, que pagam o custo de inicialização do servidor"""
+        for _ in range(_WARM_UP_ROUNDS):
+            try:
+                await self._send_message("Olá", cache=False)
+            except Exception:
+                pass
+    
+    async def _time_message(self, message: str) -> Optional[float]:
+        """Mede o tempo de resposta de uma mensagem (em conversa própria); None em caso de erro"""
+        try:
+            # O relógio começa com a vaga no semáforo já obtida: a espera na fila do cliente não entra na medida
+            async with self._sem:
+                start_time = time.perf_counter()
+                await self._post(message, self._new_user_id())
+                end_time = time.perf_counter()
+            
+            return end_time - start_time
+        
+        except Exception as e:
+            self._log(f"Erro ao testar performance com '{message}': {e}")
+            return None
+    
+    async def test_edge_cases(self) -> Dict[str, Any]:
+        """Testa casos extremos e limitações"""
+        self._log("\n=== Testando Casos Extremos ===")
+        
+        results = await asyncio.gather(*[self._run_edge_case(case) for case in _EDGE_CASES])
+        
+        return self._suite_result("edge_cases", results)
+    
+    async def _run_edge_case(self, case: Dict[str, Any]) -> Union[EdgeCaseResult, CaseError]:
+        """Executa um caso extremo (em conversa própria)"""
+        try:
+            response = await self._send_message(case["input"])
+            return self._check_edge_case(case, response)
+        except Exception as e:
+            return self._case_error(case, e)
+    
+    async def _send_message(self, message: str, user_id: Optional[str] = None, cache: bool = True) -> Dict[str, Any]:
+        """Envia mensagem para o chatbot e retorna resposta (mesmo cache da versão síncrona)"""
+        cacheable = cache and user_id is None
+        if cacheable and message in self._response_cache:
+            return self._response_cache[message]
+        
+        async with self._sem:
+            data = await self._post(message, user_id or self._new_user_id())
+        
+        if cacheable:
+            self._response_cache[message] = data
+        return data
+    
+    async def _post(self, message: str, user_id: str) -> Dict[str, Any]:
+        """Envia a mensagem ao servidor (chamado com a vaga no semáforo já obtida)"""
+        url = f"{self.base_url}/api/chat"
+        payload = {"message": message, "user_id": user_id}
+        
+        body = await self._request("POST", url, json=payload, timeout=aiohttp.ClientTimeout(total=10))
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> bytes:
+        """Faz a requisição repetindo falhas transitórias como o Retry da versão síncrona e retorna o corpo.
+        
+        Erros de conexão são sempre repetidos; respostas 502/503/504 só no GET, pois o POST não é idempotente.
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        
+        for attempt in range(_RETRY_TOTAL + 1):
+            if attempt:
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    if method == "GET" and response.status in _RETRY_STATUSES and attempt < _RETRY_TOTAL:
+                        continue
+                    if response.status != 200:
+                        response.raise_for_status()
+                    return await response.read()
+            except aiohttp.ClientConnectorError:
+                # A conexão nem chegou a ser aberta: a requisição não foi enviada
+                if attempt == _RETRY_TOTAL:
+                    raise
+    
+    async def _run_suite(self, suite) -> Dict[str, Any]:
+        """Executa uma suíte guardando sua saída, que é impressa de uma vez quando ela termina"""
+        lines = []
+        token = _suite_output.set(lines)
+        try:
+            return await suite()
+        finally:
+            _suite_output.reset(token)
+            self._print_lines(lines)
+    
+    async def close(self):
+        """Fecha a sessão HTTP (uma nova é aberta se o tester voltar a ser usado)"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        # O semáforo fica preso ao loop em que foi disputado; o próximo asyncio.run usa um novo
+        self._sem = asyncio.Semaphore(self.max_concurrent)
+    
+    async def run_all_tests(self) -> Dict[str, Any]:
+        """Executa todos os testes"""
+        self._print_header()
+        
+        try:
+            # Verificar se o servidor está rodando
+            try:
+                await self._request("GET", f"{self.base_url}/api/health", timeout=aiohttp.ClientTimeout(total=5))
+                print("✓ Servidor está online e funcionando")
+            except Exception as e:
+                print(f"✗ Erro ao conectar com o servidor: {e}")
+                return {"error": "Servidor não está acessível"}
+            
+            # Executar todos os testes (as suítes são independentes e rodam juntas no mesmo loop)
+            names = ["basic_functionality", "diagnostic_system", "nlp_capabilities", "edge_cases"]
+            suite_results = await asyncio.gather(
+                self._run_suite(self.test_basic_functionality),
+                self._run_suite(self.test_diagnostic_system),
+                self._run_suite(self.test_nlp_capabilities),
+                self._run_suite(self.test_edge_cases)
+            )
+            test_results = dict(zip(names, suite_results))
+            
+            # Performance medida depois das outras suítes, sem a carga delas no servidor
+            test_results["performance"] = await self._run_suite(self.test_performance)
+        finally:
+            # A sessão é do loop de asyncio.run, que termina junto com run_all_tests
+            await self.close()
+        
+        return self._summarize(test_results)
+
 def main():
     """Função principal para executar os testes"""
-    tester = ChatbotTester()
-    results = tester.run_all_tests()
+    parser = argparse.ArgumentParser(description="Testes do chatbot de suporte técnico com IA")
+    parser.add_argument("--max-concurrent", type=int, default=4,
+                        help="máximo de requisições simultâneas ao servidor (padrão: 4)")
+    args = parser.parse_args()
+    
+    # Variante assíncrona quando o aiohttp está instalado; senão, a síncrona (requests + threads)
+    tester_class = AsyncChatbotTester if aiohttp is not None else ChatbotTester
+    tester = tester_class(max_concurrent=args.max_concurrent)
+    if aiohttp is not None:
+        results = asyncio.run(tester.run_all_tests())
+    else:
+        try:
+            results = tester.run_all_tests()
+        finally:
+            tester.close()
     
     # Salvar resultados em arquivo
-    with open("test_results.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    results_path = Path("test_results.json")
+    if orjson is not None:
+        results_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with results_path.open("w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     
     print(f"\n📄 Resultados salvos em: test_results.json")
 